@@ -18,9 +18,13 @@ Features:
 Optional: write Parquet if desired (requires pyarrow/fastparquet)
 """
 
+import csv
+import functools
+import mmap
 import re
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 # --- Configuration ---
@@ -31,6 +35,8 @@ OUTPUT_CSV = SOURCE_PATH.with_name(SOURCE_PATH.stem + "_transformed.csv")
 UNCAT_CSV = SOURCE_PATH.with_name(SOURCE_PATH.stem + "_uncategorized.csv")
 MAPPING_PATH = BASE_DIR / "CategoryMapping.csv"  # optional; script continues if missing
 WRITE_PARQUET = False  # set True if you want .parquet too (needs pyarrow or fastparquet)
+CHUNK_ROWS = 100_000  # rows per chunk when streaming big exports
+STREAM_THRESHOLD_BYTES = 100 * 2**20  # stream instead of one-shot read above ~100 MB
 
 # Header detection
 HEADER_CANDIDATES = [
@@ -243,9 +249,52 @@ KEYWORD_RULES = [
     (["church", "salvation army", "red cross"], "Charitable Giving"),
 ]
 
+# One compiled alternation per keyword rule; main() applies them as vectorized
+# str.contains masks in rule order, so each rule is a single C-level scan over
+# the whole column and earlier rules still win.
+_KEYWORD_RULE_PATTERNS = [
+    (re.compile("|".join(re.escape(k) for k in keywords)), canon)
+    for keywords, canon in KEYWORD_RULES
+]
+
+# The ALIASES keys fused into one alternation for the loose fallback. Group
+# a<j> marks a hit for alias j; every occurrence is considered and the
+# earliest-listed alias wins, matching the old dict-ordered loop. The
+# lookahead keeps matches zero-width so overlapping hits are all seen.
+_ALIAS_CATS = list(ALIASES.values())
+_ALIAS_RE = re.compile(
+    "(?=" + "|".join("(?P<a{}>{})".format(j, re.escape(key)) for j, key in enumerate(ALIASES)) + ")"
+)
+
 
 # --- Helpers ---
 def find_header_line(path: Path) -> int:
+    # The header sits near the top of the export, so search a raw-byte prefix
+    # first instead of decoding the whole file line by line.
+    head = b""
+    with path.open("rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                head = mm[:65536]
+        except ValueError:
+            pass  # empty file; fall through to the error below
+    best = None
+    for a, b in HEADER_CANDIDATES:
+        a_b, b_b = a.encode(), b.encode()
+        pos = head.find(a_b)
+        while pos != -1:
+            start = head.rfind(b"\n", 0, pos) + 1
+            end = head.find(b"\n", pos)
+            if end == -1:
+                end = len(head)
+            if head.find(b_b, start, end) != -1:
+                if best is None or start < best:
+                    best = start
+                break
+            pos = head.find(a_b, end + 1)
+    if best is not None:
+        return head.count(b"\n", 0, best)
+    # Fall back to the full decoded scan for headers beyond the prefix.
     with path.open("r", encoding="utf-8", errors="ignore") as f:
         for i, line in enumerate(f):
             for a, b in HEADER_CANDIDATES:
@@ -254,6 +303,50 @@ def find_header_line(path: Path) -> int:
     raise ValueError("Could not find header row—adjust HEADER_CANDIDATES if needed.")
 
 
+def read_source_csv(path: Path, header_line: int) -> pd.DataFrame:
+    """Read the export as all-string columns, preferring the pyarrow CSV reader.
+
+    pyarrow parses in parallel C++ threads and backs the strings with
+    contiguous buffers; fall back to pandas if it is unavailable or chokes.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pv
+
+        # Grab the column names from the header row so every column can be
+        # requested as string (the equivalent of dtype=str below).  utf-8-sig
+        # swallows a leading BOM that would otherwise stick to the first name.
+        with path.open("r", encoding="utf-8-sig", errors="ignore", newline="") as f:
+            for _ in range(header_line):
+                next(f)
+            names = [c.strip() for c in next(csv.reader(f))]
+        if len(set(names)) != len(names):
+            # Duplicate header names would produce a duplicate-column frame;
+            # let pandas handle them (it mangles repeats to "Date.1" etc.).
+            raise ValueError("duplicate column names")
+        tbl = pv.read_csv(
+            path,
+            read_options=pv.ReadOptions(skip_rows=header_line + 1, column_names=names),
+            convert_options=pv.ConvertOptions(
+                column_types={n: pa.string() for n in names}, strings_can_be_null=False
+            ),
+        )
+        return tbl.to_pandas().fillna("")
+    except Exception:
+        return pd.read_csv(path, skiprows=header_line, dtype=str, keep_default_na=False)
+
+
+def write_output_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write with pyarrow's multithreaded CSV writer, pandas as fallback."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pv
+
+        pv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+    except Exception:
+        df.to_csv(path, index=False)
+
+
 def coerce_money(x):
     if pd.isna(x):
         return 0.0
@@ -271,6 +364,31 @@ def coerce_money(x):
     return -val if neg else val
 
 
+def coerce_money_series(s: pd.Series) -> pd.Series:
+    """Vectorized coerce_money: empty -> 0.0, unparseable -> NaN, (...) -> negative."""
+    t = s.fillna("").astype(str).str.strip()
+    # Fast path first: most cells are plain "123.45" strings that pd.to_numeric
+    # parses directly in C; only the leftovers get the $/comma/paren cleanup.
+    val = pd.to_numeric(t, errors="coerce").astype("float64")
+    todo = val.isna()
+    if todo.any():
+        u = t[todo]
+        empty = u == ""
+        neg = u.str.startswith("(") & u.str.endswith(")")
+        u = u.where(~neg, u.str.slice(1, -1))
+        u = u.str.replace("$", "", regex=False).str.replace(",", "", regex=False).str.strip()
+        fixed = pd.to_numeric(u, errors="coerce")
+        val.loc[todo] = fixed.mask(neg, -fixed).mask(empty, 0.0)
+    return val
+
+
+def coerce_money_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Coerce several money columns in one pass over their stacked values."""
+    flat = coerce_money_series(pd.Series(frame.to_numpy().ravel(order="F")))
+    arr = flat.to_numpy().reshape(len(frame.columns), len(frame)).T
+    return pd.DataFrame(arr, index=frame.index, columns=frame.columns)
+
+
 def pick_first_present(df: pd.DataFrame, names: list[str]) -> str | None:
     lower_map = {c.lower(): c for c in df.columns}
     for n in names:
@@ -279,70 +397,137 @@ def pick_first_present(df: pd.DataFrame, names: list[str]) -> str | None:
     return None
 
 
+# Compiled once at import; clean_text runs per description and re-dispatching
+# through the re module cache per call adds up. _NOISE_RE fuses the store-hash
+# and long-digit-run patterns (terminal IDs, etc.) into a single pass.
+_WS_RE = re.compile(r"\s+")
+_NOISE_RE = re.compile(r"#\d+|\d{3,}")
+
+
 def clean_text(s: str | None) -> str:
     if s is None:
         return ""
     # lowercase, strip, collapse spaces, drop common store tokens
     t = str(s).lower().strip()
-    t = re.sub(r"\s+", " ", t)
-    # remove common transaction noise like store numbers or extra hashes
-    t = re.sub(r"#\d+", "", t)
-    t = re.sub(r"\d{3,}", "", t)  # drop long digit runs (terminal IDs, etc.)
+    t = _WS_RE.sub(" ", t)
+    t = _NOISE_RE.sub("", t)
     return t.strip()
 
 
+def clean_text_series(s: pd.Series) -> pd.Series:
+    """Vectorized clean_text for whole columns (same passes, C string kernels)."""
+    t = s.fillna("").astype(str).str.lower().str.strip()
+    t = t.str.replace(_WS_RE, " ", regex=True)
+    t = t.str.replace(_NOISE_RE, "", regex=True)
+    return t.str.strip()
+
+
+# Lowercased lookup built once so canonicalize is two dict probes instead of a
+# case-insensitive scan over all of CANON per call.
+_CANON_LOWER = {c.lower(): c for c in CANON}
+
+
+# Date shapes seen in bank exports, checked against a few sample values so the
+# whole column can be parsed in one pass on the fast explicit-format path.
+_DATE_FORMATS = [
+    (re.compile(r"^\d{1,2}/\d{1,2}/\d{4}$"), "%m/%d/%Y"),
+    (re.compile(r"^\d{4}-\d{1,2}-\d{1,2}$"), "%Y-%m-%d"),
+    (re.compile(r"^\d{1,2}-\d{1,2}-\d{4}$"), "%m-%d-%Y"),
+]
+
+
+def sniff_date_format(values) -> str | None:
+    checked = 0
+    for v in values:
+        v = str(v).strip()
+        if not v:
+            continue
+        for rx, fmt in _DATE_FORMATS:
+            if rx.match(v):
+                return fmt
+        checked += 1
+        if checked >= 10:
+            break
+    return None
+
+
 def canonicalize(cat: str) -> str:
     if not cat:
         return "Uncategorized"
-    # Exact match to CANON (case-insensitive)
-    for c in CANON:
-        if c.lower() == cat.lower():
-            return c
-    # Alias
-    if cat.lower() in ALIASES:
-        return ALIASES[cat.lower()]
+    key = cat.lower()
+    # Exact match to CANON (case-insensitive), then alias
+    hit = _CANON_LOWER.get(key)
+    if hit:
+        return hit
     # Otherwise leave as-is if you want to allow custom, else force Uncategorized
-    return cat
+    return ALIASES.get(key, cat)
 
 
 def load_mapping(path: Path):
     """Load mapping CSV with columns: type, pattern, category"""
     if not path.exists():
-        return [], [], []
+        return {}, (None, []), []
     m = pd.read_csv(path, dtype=str).fillna("")
     # Clean
     m["type"] = m["type"].str.lower().str.strip()
     m["pattern"] = m["pattern"].map(clean_text)
     m["category"] = m["category"].map(lambda x: canonicalize(str(x)))
-    exact = [
-        (row.pattern, row.category) for _, row in m[m["type"] == "exact"].iterrows() if row.pattern
-    ]
-    contains = [
-        (row.pattern, row.category)
-        for _, row in m[m["type"] == "contains"].iterrows()
-        if row.pattern
-    ]
+
+    def rows_of(kind: str):
+        # zip over the raw ndarrays rather than iterrows, which boxes every
+        # row into a Series
+        mask = (m["type"] == kind) & (m["pattern"] != "")
+        return zip(m.loc[mask, "pattern"].to_numpy(), m.loc[mask, "category"].to_numpy())
+
+    # Exact patterns go into a dict so lookup is O(1) instead of a scan over
+    # every mapping row (first occurrence of a duplicate pattern wins, as the
+    # old linear scan did).
+    exact = {}
+    for patt, cat in rows_of("exact"):
+        if patt not in exact:
+            exact[patt] = cat
+    contains_rows = list(rows_of("contains"))
+    # Fuse all contains patterns into one alternation so a description is
+    # scanned once instead of once per pattern; the matching group index
+    # tells us which pattern (and hence category) hit.  The alternation is
+    # wrapped in a zero-width lookahead so overlapping patterns are all
+    # visible and earlier rows keep priority over later ones.
+    contains_re = None
+    contains_cats = [cat for _, cat in contains_rows]
+    if contains_rows:
+        contains_re = re.compile(
+            "(?="
+            + "|".join(f"(?P<c{i}>{re.escape(patt)})" for i, (patt, _) in enumerate(contains_rows))
+            + ")",
+            flags=re.I,
+        )
     regex = []
-    for _, row in m[m["type"] == "regex"].iterrows():
-        if not row.pattern:
-            continue
+    for patt, cat in rows_of("regex"):
         try:
-            regex.append((re.compile(row.pattern, flags=re.I), row.category))
+            regex.append((re.compile(patt, flags=re.I), cat))
         except re.error:
             # skip invalid regex patterns silently
             continue
-    return exact, contains, regex
+    return exact, (contains_re, contains_cats), regex
 
 
 def apply_mapping(desc_clean: str, exact, contains, regex):
-    # 1) exact
-    for patt, cat in exact:
-        if desc_clean == patt:
-            return cat
-    # 2) contains
-    for patt, cat in contains:
-        if patt and patt in desc_clean:
-            return cat
+    # 1) exact (dict probe)
+    cat = exact.get(desc_clean)
+    if cat:
+        return cat
+    # 2) contains (single fused alternation, one scan per description)
+    contains_re, contains_cats = contains
+    if contains_re is not None:
+        best = None
+        for hit in contains_re.finditer(desc_clean):
+            idx = hit.lastindex - 1
+            if best is None or idx < best:
+                best = idx
+                if best == 0:
+                    break
+        if best is not None:
+            return contains_cats[best]
     # 3) regex
     for rx, cat in regex:
         if rx.search(desc_clean):
@@ -350,127 +535,183 @@ def apply_mapping(desc_clean: str, exact, contains, regex):
     return None
 
 
-def fallback_keyword_rules(haystack: str):
-    for keywords, canon in KEYWORD_RULES:
-        if any(k in haystack for k in keywords):
-            return canon
-    # scan aliases as very loose fallback
-    for key, canon in ALIASES.items():
-        if key in haystack:
-            return canon
+@functools.lru_cache(maxsize=None)
+def fallback_alias(haystack: str):
+    best = None
+    for hit in _ALIAS_RE.finditer(haystack):
+        idx = hit.lastindex - 1
+        if best is None or idx < best:
+            best = idx
+            if best == 0:
+                break
+    if best is not None:
+        return _ALIAS_CATS[best]
     return None
 
 
-# --- Main ---
-def main():
-    if not SOURCE_PATH.exists():
-        raise FileNotFoundError(f"Source file not found:\n{SOURCE_PATH}")
+def make_description_mapper(mapping):
+    """Return a cached description -> category (or None) mapper for one run.
 
-    header_line = find_header_line(SOURCE_PATH)
+    The lru_cache persists across chunks, so a merchant seen in an earlier
+    chunk skips the exact/contains/regex cascade entirely.
+    """
+    exact, contains, regex = mapping
 
-    df = pd.read_csv(
-        SOURCE_PATH,
-        skiprows=header_line,
-        dtype=str,
-        keep_default_na=False,
-    )
+    @functools.lru_cache(maxsize=None)
+    def map_description(desc_clean: str):
+        c = apply_mapping(desc_clean, exact, contains, regex)
+        return canonicalize(c) if c else None
+
+    return map_description
+
+
+def transform_chunk(df: pd.DataFrame, map_description, start_seq: int = 1) -> pd.DataFrame:
+    """Run the full transform pipeline over one already-read string DataFrame.
+
+    start_seq keeps AccountSeq monotonic when the source is streamed in
+    chunks; map_description comes from make_description_mapper.
+    """
     df.columns = [c.strip() for c in df.columns]
 
     # Account + AccountSeq
     df.insert(0, "Account", ACCOUNT_ID)
-    seq = pd.Series(range(1, len(df) + 1), index=df.index).map(lambda i: f"{ACCOUNT_ID}-{i:04d}")
+    seq = (
+        ACCOUNT_ID
+        + "-"
+        + pd.Series(np.arange(start_seq, start_seq + len(df)), index=df.index)
+        .astype(str)
+        .str.zfill(4)
+    )
     df.insert(1, "AccountSeq", seq)
 
     # Date
     date_col = pick_first_present(df, ["Date", "Posting Date", "Transaction Date"])
     if date_col is None:
         raise ValueError("No date column found.")
+    raw_dates = df[date_col].str.strip()
+    # Sniff the format from a few samples and parse the whole column once on
+    # the explicit-format C path; fmt=None falls back to per-element inference.
+    fmt = sniff_date_format(raw_dates.head(50))
     parsed_dates = pd.to_datetime(
-        df[date_col].str.strip().replace("", pd.NA), errors="coerce", infer_datetime_format=True
+        raw_dates.replace("", pd.NA), format=fmt, errors="coerce", cache=True
     )
-    if parsed_dates.isna().all():
-        parsed_dates = pd.to_datetime(df[date_col], format="%m/%d/%Y", errors="coerce")
     df["Date"] = parsed_dates.dt.strftime("%Y-%m-%d")
 
-    # Amount
+    # Amount + optional numeric balance: clean every money column in a single
+    # fused pass instead of one full materialization per column.
     debit_col = pick_first_present(df, ["Debit", "Debits", "Withdrawal", "Withdrawals"])
     credit_col = pick_first_present(df, ["Credit", "Credits", "Deposit", "Deposits"])
-    if debit_col or credit_col:
-        debit = df[debit_col].map(coerce_money) if debit_col else 0.0
-        credit = df[credit_col].map(coerce_money) if credit_col else 0.0
-        df["Amount"] = pd.to_numeric(credit, errors="coerce") - pd.to_numeric(
-            debit, errors="coerce"
-        )
-    else:
+    balance_col = pick_first_present(df, ["Running Balance", "Balance"])
+    amount_col = None
+    if not (debit_col or credit_col):
         amount_col = pick_first_present(df, ["Amount", "Transaction Amount"])
         if amount_col is None:
             raise ValueError("No amount columns found.")
-        df["Amount"] = pd.to_numeric(df[amount_col].map(coerce_money), errors="coerce")
-
-    # Optional numeric balance
-    balance_col = pick_first_present(df, ["Running Balance", "Balance"])
+    money_cols = [c for c in (debit_col, credit_col, amount_col, balance_col) if c]
+    nums = coerce_money_frame(df[money_cols])
+    if debit_col or credit_col:
+        debit = nums[debit_col] if debit_col else 0.0
+        credit = nums[credit_col] if credit_col else 0.0
+        df["Amount"] = credit - debit
+    else:
+        df["Amount"] = nums[amount_col]
     if balance_col:
-        df["Running Balance (num)"] = pd.to_numeric(
-            df[balance_col].map(coerce_money), errors="coerce"
-        )
+        df["Running Balance (num)"] = nums[balance_col]
 
     # Prepare text for mapping
     desc_col = pick_first_present(df, ["Description", "Payee", "Memo", "Details"])
-    df["Description (clean)"] = df[desc_col].map(clean_text) if desc_col else ""
+    df["Description (clean)"] = clean_text_series(df[desc_col]) if desc_col else ""
+    # Descriptions repeat heavily (same merchants recur), so store them
+    # dictionary-encoded: downstream map/value_counts work on the small
+    # categories array and memory drops accordingly.
+    df["Description (clean)"] = df["Description (clean)"].astype("category")
 
     # Preserve raw Category if present
     if "Category" in df.columns:
-        df["Category (raw)"] = df["Category"]
+        df["Category (raw)"] = df["Category"].astype("category")
     else:
-        df["Category (raw)"] = ""
-
-    # Load user mapping
-    exact, contains, regex = load_mapping(MAPPING_PATH)
-
-    # Apply mapping → fallback rules → fallback aliases → Uncategorized
-    def categorize_row(row):
-        # Priority 0: if you trust existing Category, uncomment next lines:
-        # if row["Category (raw)"].strip():
-        #     return canonicalize(row["Category (raw)"])
-
-        # Priority 1: user mapping file
-        c = apply_mapping(row["Description (clean)"], exact, contains, regex)
-        if c:
-            return canonicalize(c)
-
-        # Priority 2: keyword rules using description + raw category text
-        hay = f"{row['Description (clean)']} {clean_text(row['Category (raw)'])}".strip()
-        c = fallback_keyword_rules(hay)
-        if c:
-            return c
-
-        # Priority 3: try aliasing raw category directly
-        raw = clean_text(row["Category (raw)"])
-        if raw in ALIASES:
-            return ALIASES[raw]
-
-        return "Uncategorized"
-
-    df["Category"] = df.apply(categorize_row, axis=1)
+        df["Category (raw)"] = pd.Categorical([""] * len(df))
+
+    # Raw alias -> mapping -> keyword rules -> alias fallback -> Uncategorized
+    raw_clean = clean_text_series(df["Category (raw)"])
+    desc = df["Description (clean)"]
+    # Rows whose bank-provided category aliases directly are filled in one
+    # vectorized map and skip the cascade entirely.
+    cats = raw_clean.map(ALIASES).astype(object)
+    unresolved = cats.isna()
+
+    # User mapping file, run once per unique description (merchants repeat).
+    if unresolved.any():
+        map_dict = {}
+        for d in desc[unresolved].unique():
+            c = map_description(d)
+            if c:
+                map_dict[d] = c
+        cats.loc[unresolved] = desc[unresolved].map(map_dict).astype(object)
+        unresolved = cats.isna()
+
+    # Keyword rules: one vectorized scan per rule over the still-unresolved
+    # rows, in rule order so earlier rules keep priority.
+    hay = (desc.astype(str) + " " + raw_clean).str.strip()
+    for rx, canon in _KEYWORD_RULE_PATTERNS:
+        if not unresolved.any():
+            break
+        hit = unresolved & hay.str.contains(rx, regex=True, na=False)
+        if hit.any():
+            cats.loc[hit] = canon
+            unresolved &= ~hit
+
+    # Loose alias fallback on the unique unresolved haystacks.
+    if unresolved.any():
+        alias_dict = {h: fallback_alias(h) for h in hay[unresolved].unique()}
+        cats.loc[unresolved] = hay[unresolved].map(alias_dict)
+
+    df["Category"] = cats.fillna("Uncategorized")
 
     # Column order
     front = [c for c in ["Account", "AccountSeq", "Date", "Amount", "Category"] if c in df.columns]
     remaining = [c for c in df.columns if c not in front]
-    df = df[front + remaining]
+    return df[front + remaining]
+
+
+# --- Main ---
+def main():
+    if not SOURCE_PATH.exists():
+        raise FileNotFoundError(f"Source file not found:\n{SOURCE_PATH}")
+
+    header_line = find_header_line(SOURCE_PATH)
+    map_description = make_description_mapper(load_mapping(MAPPING_PATH))
 
-    # Write output
-    df.to_csv(OUTPUT_CSV, index=False)
+    unc_parts = []
+    if SOURCE_PATH.stat().st_size <= STREAM_THRESHOLD_BYTES:
+        df = transform_chunk(read_source_csv(SOURCE_PATH, header_line), map_description)
+        write_output_csv(df, OUTPUT_CSV)
+        unc_parts.append(df.loc[df["Category"] == "Uncategorized", "Description (clean)"])
+    else:
+        # Stream big exports in chunks and append to the output incrementally,
+        # so peak memory stays at one chunk plus the mapping tables.
+        df = None
+        next_seq = 1
+        reader = pd.read_csv(
+            SOURCE_PATH,
+            skiprows=header_line,
+            dtype=str,
+            keep_default_na=False,
+            chunksize=CHUNK_ROWS,
+        )
+        for i, chunk in enumerate(reader):
+            out = transform_chunk(chunk, map_description, start_seq=next_seq)
+            next_seq += len(out)
+            out.to_csv(OUTPUT_CSV, index=False, mode="w" if i == 0 else "a", header=(i == 0))
+            unc_parts.append(out.loc[out["Category"] == "Uncategorized", "Description (clean)"])
     print(f"Done. Wrote transformed CSV to:\n{OUTPUT_CSV}")
 
     # Emit uncategorized summary to help you grow the map
-    unc = (
-        df.loc[df["Category"] == "Uncategorized", ["Description (clean)"]]
-        .rename(columns={"Description (clean)": "pattern"})
-        .assign(type="exact", category="")
-        .value_counts("pattern")
-        .reset_index(name="count")
-        .sort_values("count", ascending=False)
-    )
+    unc_desc = pd.concat(unc_parts).astype(str) if unc_parts else pd.Series(dtype=str)
+    unc = unc_desc.value_counts().rename_axis("pattern").reset_index(name="count")
+    unc["type"] = "exact"
+    unc["category"] = ""
+    unc = unc[["pattern", "type", "category", "count"]]
     if not unc.empty:
         unc.to_csv(UNCAT_CSV, index=False)
         print(f"Wrote suggestions for mapping (uncategorized descriptions) to:\n{UNCAT_CSV}")
@@ -479,12 +720,15 @@ def main():
         )
 
     if WRITE_PARQUET:
-        pq_path = OUTPUT_CSV.with_suffix(".parquet")
-        try:
-            df.to_parquet(pq_path, engine="pyarrow", index=False)
-        except Exception:
-            df.to_parquet(pq_path, engine="fastparquet", index=False)
-        print(f"Also wrote Parquet to:\n{pq_path}")
+        if df is None:
+            print("Parquet output is skipped for streamed (chunked) sources.")
+        else:
+            pq_path = OUTPUT_CSV.with_suffix(".parquet")
+            try:
+                df.to_parquet(pq_path, engine="pyarrow", index=False)
+            except Exception:
+                df.to_parquet(pq_path, engine="fastparquet", index=False)
+            print(f"Also wrote Parquet to:\n{pq_path}")
 
 
 if __name__ == "__main__":
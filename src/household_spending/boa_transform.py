@@ -19,11 +19,17 @@ Public helpers (used in tests): coerce_money, normalize_merchant
 from __future__ import annotations
 
 import argparse
+import csv
+import functools
+import mmap
+import os
+import pickle
 import re
 import sys
 from collections import Counter
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 CANON = [
@@ -102,6 +108,11 @@ ALIASES = {
     "irs": "Taxes",
 }
 
+# Lowercased lookup tables so canonicalization is two dict probes instead of
+# a scan over CANON (alias keys are already lowercase, but stay defensive).
+_CANON_LOWER = {c.lower(): c for c in CANON}
+_ALIASES_LOWER = {k.lower(): v for k, v in ALIASES.items()}
+
 KEYWORD_RULES = [
     (["whole foods", "market basket", "stop & shop", "trader joe", "aldi", "shaw's"], "Groceries"),
     (
@@ -131,6 +142,40 @@ KEYWORD_RULES = [
     (["church", "salvation army", "red cross"], "Gifts/Charity"),
 ]
 
+# Provenance sentinels: categorization stages record a small int per unique
+# description and the report counter comes from one bincount at the end.
+(
+    _PROV_EXACT,
+    _PROV_CONTAINS,
+    _PROV_REGEX,
+    _PROV_KEYWORD,
+    _PROV_ALIAS,
+    _PROV_ALIAS_RAW,
+    _PROV_UNCAT,
+) = range(7)
+_PROVENANCE_LABELS = [
+    "mapping_exact",
+    "mapping_contains",
+    "mapping_regex",
+    "keyword_rule",
+    "alias_rule",
+    "alias_raw",
+    "uncategorized",
+]
+
+# Keyword rules and alias keys fused into one alternation for the fallback
+# stage, listed in priority order (rules first, then aliases). Group k<j>
+# marks a hit for token j; the zero-width lookahead keeps matches from
+# consuming text, so overlapping hits are all seen and the earliest-listed
+# token wins — the same semantics as the old per-row substring loops.
+_FALLBACK_KEYS = [k for keywords, _ in KEYWORD_RULES for k in keywords] + list(ALIASES)
+_FALLBACK_CATS = [(canon, _PROV_KEYWORD) for keywords, canon in KEYWORD_RULES for _ in keywords] + [
+    (canon, _PROV_ALIAS) for canon in ALIASES.values()
+]
+_FALLBACK_RE = re.compile(
+    "(?=" + "|".join(f"(?P<k{j}>{re.escape(k)})" for j, k in enumerate(_FALLBACK_KEYS)) + ")"
+)
+
 HEADER_CANDIDATES = [
     ("Date", "Description"),
     ("Posting Date", "Description"),
@@ -138,6 +183,11 @@ HEADER_CANDIDATES = [
     ("Transaction Date", "Description"),
 ]
 
+# Inputs at or above the threshold are processed in chunks so peak memory
+# stays at one chunk plus the mapping tables.
+_STREAM_THRESHOLD_BYTES = 100 * 2**20
+_CHUNK_ROWS = 200_000
+
 _VENDOR_STOPWORDS = {
     "authorization",
     "auth",
@@ -167,12 +217,10 @@ _VENDOR_STOPWORDS = {
     "adj",
     "refund",
 }
-_VENDOR_STRIP_REGEXES = [
-    re.compile(r"#\d+"),
-    re.compile(r"\b\d{3,}\b"),
-    re.compile(r"\s{2,}"),
-    re.compile(r"[^a-z0-9 &.'-]"),
-]
+# One pass strips reference numbers, long digit runs and stray characters;
+# a second collapses the whitespace that replacement leaves behind.
+_STRIP_ONE = re.compile(r"#\d+|\b\d{3,}\b|[^a-z0-9 &.'-]")
+_WS = re.compile(r"\s+")
 MERCHANT_ALIASES = {
     "the home depot": "Home Depot",
     "home depot": "Home Depot",
@@ -193,6 +241,22 @@ MERCHANT_ALIASES = {
     "geico insurance": "GEICO",
 }
 
+# Precompiled pieces of normalize_merchant; the title-cased probe strings
+# let the acronym fixups run only when the literal text is present.
+_RX_DC_PURCHASE = re.compile(r"^(debit|credit)\s+card\s+purchase\s+")
+_RX_PURCHASE_POS = re.compile(r"^(purchase|pos)\s+")
+_RX_ALIAS_TAIL = re.compile(r"\b(store|stn|st|unit|loc)\b.*$")
+_KEEP_UPPER = [
+    (re.compile(rf"\b{k.title()}\b"), k.title(), k) for k in ("GEICO", "IRS", "MBTA", "BP", "AT&T")
+]
+
+# The merchant aliases fused the same way as the fallback tokens: one scan
+# per description, earliest-listed key wins, overlaps all seen.
+_MERCHANT_ALIAS_CATS = list(MERCHANT_ALIASES.values())
+_MERCHANT_ALIAS_RE = re.compile(
+    "(?=" + "|".join(f"(?P<m{j}>{re.escape(k)})" for j, k in enumerate(MERCHANT_ALIASES)) + ")"
+)
+
 
 def coerce_money(x) -> float | pd.NA:
     """Convert money-like strings to float."""
@@ -212,16 +276,25 @@ def coerce_money(x) -> float | pd.NA:
     return -val if neg else val
 
 
+def coerce_money_series(s: pd.Series) -> pd.Series:
+    """Column-wise coerce_money: empty -> 0.0, unparseable -> NaN, (...) -> negative."""
+    t = s.fillna("").astype(str).str.strip()
+    empty = t == ""
+    neg = t.str.startswith("(") & t.str.endswith(")")
+    t = t.where(~neg, t.str.slice(1, -1))
+    t = t.str.replace("$", "", regex=False).str.replace(",", "", regex=False).str.strip()
+    val = pd.to_numeric(t, errors="coerce")
+    return val.mask(neg, -val).mask(empty, 0.0)
+
+
 def _normalize_ws(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+    return _WS.sub(" ", s).strip()
 
 
 def _clean_text(s: str | None) -> str:
     if s is None:
         return ""
-    t = str(s).lower()
-    for rx in _VENDOR_STRIP_REGEXES:
-        t = rx.sub(" ", t)
+    t = _STRIP_ONE.sub(" ", str(s).lower())
     return _normalize_ws(t)
 
 
@@ -231,97 +304,212 @@ def normalize_merchant(desc_clean: str) -> str:
         return ""
     tokens = [tok for tok in desc_clean.split(" ") if tok and tok not in _VENDOR_STOPWORDS]
     base = _normalize_ws(" ".join(tokens))
-    base = re.sub(r"^(debit|credit)\s+card\s+purchase\s+", "", base)
-    base = re.sub(r"^(purchase|pos)\s+", "", base)
-    alias_key = re.sub(r"\b(store|stn|st|unit|loc)\b.*$", "", base).strip()
-    for k, v in MERCHANT_ALIASES.items():
-        if k in alias_key:
-            return v
+    if base.startswith(("debit", "credit")):
+        base = _RX_DC_PURCHASE.sub("", base)
+    if base.startswith(("purchase", "pos")):
+        base = _RX_PURCHASE_POS.sub("", base)
+    alias_key = _RX_ALIAS_TAIL.sub("", base).strip()
+    best = _first_listed_match(_MERCHANT_ALIAS_RE, alias_key)
+    if best is not None:
+        return _MERCHANT_ALIAS_CATS[best]
     if not base:
         return ""
     name = base.title()
-    for keep in ["GEICO", "IRS", "MBTA", "BP", "AT&T"]:
-        name = re.sub(rf"\b{keep.title()}\b", keep, name)
+    for rx, probe, keep in _KEEP_UPPER:
+        if probe in name:
+            name = rx.sub(keep, name)
     return name
 
 
+@functools.lru_cache(maxsize=4096)
 def _canonicalize(cat: str) -> str:
     if not cat:
         return "Uncategorized"
-    for c in CANON:
-        if c.lower() == cat.lower():
-            return c
-    if cat.lower() in ALIASES:
-        return ALIASES[cat.lower()]
-    return cat
+    k = cat.lower()
+    return _CANON_LOWER.get(k) or _ALIASES_LOWER.get(k) or cat
 
 
-def _pick_first_present(df: pd.DataFrame, names: list[str]) -> str | None:
-    lower_map = {c.lower(): c for c in df.columns}
-    for n in names:
-        if n.lower() in lower_map:
-            return lower_map[n.lower()]
-    return None
+def _pick_first_present(lower_map: dict[str, str], names: list[str]) -> str | None:
+    return next((lower_map[n.lower()] for n in names if n.lower() in lower_map), None)
 
 
 def _find_header_line(path: Path) -> int:
-    with path.open("r", encoding="utf-8", errors="ignore") as f:
-        for i, line in enumerate(f):
-            for a, b in HEADER_CANDIDATES:
-                if a in line and b in line:
-                    return i
+    """Locate the header row with byte searches over an mmap; nothing is decoded."""
+    with path.open("rb") as f:
+        if path.stat().st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                best = None
+                for a, b in HEADER_CANDIDATES:
+                    needle, other = a.encode(), b.encode()
+                    pos = 0
+                    while (ia := mm.find(needle, pos)) >= 0:
+                        start = mm.rfind(b"\n", 0, ia) + 1
+                        end = mm.find(b"\n", ia)
+                        if end < 0:
+                            end = len(mm)
+                        if other in mm[start:end]:
+                            if best is None or start < best:
+                                best = start
+                            break
+                        pos = end + 1
+                if best is not None:
+                    return mm[:best].count(b"\n")
     raise ValueError("Could not find header rowâ€”adjust HEADER_CANDIDATES.")
 
 
+def _read_source_csv(path: Path, header_line: int) -> pd.DataFrame:
+    """Read the export into all-string columns, preferring pyarrow's CSV reader.
+
+    pyarrow tokenizes in parallel native threads; if it is missing or rejects
+    the file, fall back to the plain pandas reader.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pv
+
+        # pyarrow needs explicit column names to honor a per-column string
+        # type, so pull them from the header row first; utf-8-sig swallows a
+        # leading BOM that would otherwise stick to the first name.
+        with path.open("r", encoding="utf-8-sig", errors="ignore", newline="") as f:
+            for _ in range(header_line):
+                next(f)
+            names = [c.strip() for c in next(csv.reader(f))]
+        if len(set(names)) != len(names):
+            # Duplicate header names would produce a duplicate-column frame;
+            # let pandas handle them (it mangles repeats to "Date.1" etc.).
+            raise ValueError("duplicate column names")
+        tbl = pv.read_csv(
+            path,
+            read_options=pv.ReadOptions(skip_rows=header_line + 1, column_names=names),
+            convert_options=pv.ConvertOptions(
+                column_types={n: pa.string() for n in names}, strings_can_be_null=False
+            ),
+        )
+        return tbl.to_pandas().fillna("")
+    except Exception:
+        return pd.read_csv(path, skiprows=header_line, dtype=str, keep_default_na=False)
+
+
+def _write_output_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write through pyarrow's native CSV writer, falling back to pandas."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pv
+
+        pv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+    except Exception:
+        df.to_csv(path, index=False)
+
+
+def _mapping_cache_path(path: Path) -> Path:
+    st = path.stat()
+    return path.with_name(f"{path.name}.cache-{st.st_mtime_ns}-{st.st_size}.pkl")
+
+
 def _load_mapping(path: Path | None):
     if not path or not path.exists():
-        return [], [], []
+        return {}, [], (None, [])
+    # A pickled side-file keyed by the CSV's mtime and size skips the
+    # parse/clean/compile work on repeat invocations; compiled re.Pattern
+    # objects pickle fine. Cache failures of any kind fall through to the
+    # normal parse.
+    try:
+        cache_path = _mapping_cache_path(path)
+        if cache_path.exists():
+            with cache_path.open("rb") as f:
+                return pickle.load(f)
+    except Exception:
+        cache_path = None
     m = pd.read_csv(path, dtype=str).fillna("")
     if not {"type", "pattern", "category"}.issubset(m.columns):
         raise ValueError(f"Mapping file {path} must have columns: type, pattern, category")
     m["type"] = m["type"].str.lower().str.strip()
     m["pattern"] = m["pattern"].map(_clean_text)
     m["category"] = m["category"].map(_canonicalize)
-    exact = [
-        (row.pattern, row.category) for _, row in m[m["type"] == "exact"].iterrows() if row.pattern
-    ]
-    contains = [
-        (row.pattern, row.category)
-        for _, row in m[m["type"] == "contains"].iterrows()
-        if row.pattern
-    ]
-    regex = []
-    for _, row in m[m["type"] == "regex"].iterrows():
-        if not row.pattern:
+
+    def rows_of(kind: str):
+        sel = m[m["type"] == kind]
+        return zip(sel["pattern"].to_numpy(), sel["category"].to_numpy())
+
+    exact: dict[str, str] = {}
+    for patt, cat in rows_of("exact"):
+        if patt and patt not in exact:
+            exact[patt] = cat
+    contains = [(patt, cat) for patt, cat in rows_of("contains") if patt]
+    regex_rows = []
+    for patt, cat in rows_of("regex"):
+        if not patt:
             continue
         try:
-            regex.append((re.compile(row.pattern, flags=re.I), row.category))
+            regex_rows.append((re.compile(patt, flags=re.I), patt, cat))
         except re.error:
             continue
-    return exact, contains, regex
-
-
-def _apply_mapping(desc_clean: str, exact, contains, regex):
-    for patt, cat in exact:
-        if desc_clean == patt:
-            return cat, "mapping_exact"
+    # One alternation over all regex rows, used as a single prefilter pass;
+    # only rows it hits are run through the per-pattern loop to resolve
+    # which rule matched (patterns may contain their own groups, so group
+    # indices in the combined match are not reliable).
+    combined = None
+    if regex_rows:
+        try:
+            combined = re.compile("|".join(f"(?:{p})" for _, p, _ in regex_rows), flags=re.I)
+        except re.error:
+            combined = None
+    regex = (combined, [(rx, cat) for rx, _, cat in regex_rows])
+    mapping = (exact, contains, regex)
+    if cache_path is not None:
+        try:
+            tmp = cache_path.with_name(f"{cache_path.name}.tmp-{os.getpid()}")
+            with tmp.open("wb") as f:
+                pickle.dump(mapping, f)
+            os.replace(tmp, cache_path)
+            for stale in path.parent.glob(f"{path.name}.cache-*.pkl"):
+                if stale != cache_path:
+                    stale.unlink(missing_ok=True)
+        except Exception:
+            pass
+    return mapping
+
+
+def _first_listed_match(rx: re.Pattern, text: str) -> int | None:
+    """Index of the earliest-listed alternation group matching anywhere in text."""
+    best = None
+    for m in rx.finditer(text):
+        idx = m.lastindex - 1
+        if best is None or idx < best:
+            best = idx
+            if best == 0:
+                break
+    return best
+
+
+def _fallback_scan(haystack: str) -> tuple[str, int] | tuple[None, None]:
+    """One fused scan over keyword rules then aliases; earliest-listed token wins."""
+    best = _first_listed_match(_FALLBACK_RE, haystack)
+    if best is None:
+        return None, None
+    return _FALLBACK_CATS[best]
+
+
+def _categorize_unique(desc_clean: str, raw_clean: str, mapping) -> tuple[str, int]:
+    """Run the full rule cascade for one unique (description, raw category) pair."""
+    exact, contains, regex = mapping
+    cat = exact.get(desc_clean)
+    if cat is not None:
+        return cat, _PROV_EXACT
     for patt, cat in contains:
-        if patt and patt in desc_clean:
-            return cat, "mapping_contains"
-    for rx, cat in regex:
-        if rx.search(desc_clean):
-            return cat, "mapping_regex"
-    return None, None
-
-
-def _fallback_keyword_rules(haystack: str):
-    for keywords, canon in KEYWORD_RULES:
-        if any(k in haystack for k in keywords):
-            return canon, "keyword_rule"
-    for key, canon in ALIASES.items():
-        if key in haystack:
-            return canon, "alias_rule"
-    return None, None
+        if patt in desc_clean:
+            return _canonicalize(cat), _PROV_CONTAINS
+    combined_rx, regex_rules = regex
+    if regex_rules and (combined_rx is None or combined_rx.search(desc_clean)):
+        for rx, cat in regex_rules:
+            if rx.search(desc_clean):
+                return _canonicalize(cat), _PROV_REGEX
+    cat, prov = _fallback_scan((desc_clean + " " + raw_clean).strip())
+    if cat is not None:
+        return cat, prov
+    if raw_clean in ALIASES:
+        return ALIASES[raw_clean], _PROV_ALIAS_RAW
+    return "Uncategorized", _PROV_UNCAT
 
 
 def _default_mapping_path_for(source_path: Path) -> Path | None:
@@ -334,95 +522,110 @@ def _default_mapping_path_for(source_path: Path) -> Path | None:
     return None
 
 
-def transform(
-    source: Path,
-    category_mapping: Path | None = None,
-    learn_from: Path | None = None,
-    learn: bool = False,
-    report: bool = False,
-    write_parquet: bool = False,
-    account_id: str = "BOA-5670",
-) -> Path:
-    """Transform a bank CSV and write outputs next to the source file."""
-    if not source.exists():
-        raise FileNotFoundError(f"Source file not found: {source}")
-
-    header_line = _find_header_line(source)
-    df = pd.read_csv(source, skiprows=header_line, dtype=str, keep_default_na=False)
+def _transform_frame(
+    df: pd.DataFrame, account_id: str, start_seq: int, mapping
+) -> tuple[pd.DataFrame, Counter]:
+    """Run the row pipeline on one frame; start_seq numbers AccountSeq across chunks."""
     df.columns = [c.strip() for c in df.columns]
+    lower_map = {c.lower(): c for c in df.columns}
 
     df.insert(0, "Account", account_id)
-    seq = pd.Series(range(1, len(df) + 1), index=df.index).map(lambda i: f"{account_id}-{i:04d}")
+    idx = np.arange(start_seq, start_seq + len(df))
+    seq = account_id + "-" + pd.Series(idx.astype(str), index=df.index).str.zfill(4)
     df.insert(1, "AccountSeq", seq)
 
-    date_col = _pick_first_present(df, ["Date", "Posting Date", "Transaction Date"])
+    date_col = _pick_first_present(lower_map, ["Date", "Posting Date", "Transaction Date"])
     if date_col is None:
         raise ValueError("No date column found.")
-    parsed_dates = pd.to_datetime(
-        df[date_col].str.strip().replace("", pd.NA), errors="coerce", infer_datetime_format=True
-    )
-    if parsed_dates.isna().all():
-        parsed_dates = pd.to_datetime(df[date_col], format="%m/%d/%Y", errors="coerce")
+    # Bank exports are almost always MM/DD/YYYY, so try the explicit format
+    # first (a single C-level pass) and fall back to inference only for the
+    # non-empty values it could not parse.
+    date_raw = df[date_col].fillna("").astype(str).str.strip()
+    parsed_dates = pd.to_datetime(date_raw, format="%m/%d/%Y", errors="coerce")
+    fallback = parsed_dates.isna() & date_raw.ne("")
+    if fallback.any():
+        parsed_dates.loc[fallback] = pd.to_datetime(date_raw[fallback], errors="coerce")
     df["Date"] = parsed_dates.dt.strftime("%Y-%m-%d")
 
-    debit_col = _pick_first_present(df, ["Debit", "Debits", "Withdrawal", "Withdrawals"])
-    credit_col = _pick_first_present(df, ["Credit", "Credits", "Deposit", "Deposits"])
+    debit_col = _pick_first_present(lower_map, ["Debit", "Debits", "Withdrawal", "Withdrawals"])
+    credit_col = _pick_first_present(lower_map, ["Credit", "Credits", "Deposit", "Deposits"])
     if debit_col or credit_col:
-        debit = df[debit_col].map(coerce_money) if debit_col else 0.0
-        credit = df[credit_col].map(coerce_money) if credit_col else 0.0
-        df["Amount"] = pd.to_numeric(credit, errors="coerce") - pd.to_numeric(
-            debit, errors="coerce"
-        )
+        debit = coerce_money_series(df[debit_col]) if debit_col else 0.0
+        credit = coerce_money_series(df[credit_col]) if credit_col else 0.0
+        df["Amount"] = credit - debit
     else:
-        amount_col = _pick_first_present(df, ["Amount", "Transaction Amount"])
+        amount_col = _pick_first_present(lower_map, ["Amount", "Transaction Amount"])
         if amount_col is None:
             raise ValueError("No amount columns found.")
-        df["Amount"] = pd.to_numeric(df[amount_col].map(coerce_money), errors="coerce")
+        df["Amount"] = coerce_money_series(df[amount_col])
 
-    balance_col = _pick_first_present(df, ["Running Balance", "Balance"])
+    balance_col = _pick_first_present(lower_map, ["Running Balance", "Balance"])
     if balance_col:
-        df["Running Balance (num)"] = pd.to_numeric(
-            df[balance_col].map(coerce_money), errors="coerce"
+        df["Running Balance (num)"] = coerce_money_series(df[balance_col])
+
+    desc_col = _pick_first_present(lower_map, ["Description", "Payee", "Memo", "Details"])
+    if desc_col:
+        # Statements repeat the same descriptions heavily, so clean and
+        # normalize the unique values only and map the results back.
+        raw_desc = df[desc_col].fillna("").astype(str)
+        uniq = pd.Series(raw_desc.unique())
+        cleaned = (
+            uniq.str.lower()
+            .str.replace(_STRIP_ONE, " ", regex=True)
+            .str.replace(_WS, " ", regex=True)
+            .str.strip()
         )
-
-    desc_col = _pick_first_present(df, ["Description", "Payee", "Memo", "Details"])
-    df["Description (clean)"] = df[desc_col].map(_clean_text) if desc_col else ""
-    df["Merchant"] = df["Description (clean)"].map(normalize_merchant)
+        df["Description (clean)"] = raw_desc.map(dict(zip(uniq, cleaned)))
+    else:
+        df["Description (clean)"] = ""
+    merch_map = {c: normalize_merchant(c) for c in df["Description (clean)"].unique()}
+    df["Merchant"] = df["Description (clean)"].map(merch_map)
 
     if "Category" in df.columns:
         df["Category (raw)"] = df["Category"]
     else:
         df["Category (raw)"] = ""
 
-    if category_mapping is None:
-        category_mapping = _default_mapping_path_for(source)
+    desc = df["Description (clean)"]
+    raw_clean = (
+        df["Category (raw)"]
+        .fillna("")
+        .astype(str)
+        .str.lower()
+        .str.replace(_STRIP_ONE, " ", regex=True)
+        .str.replace(_WS, " ", regex=True)
+        .str.strip()
+    )
 
-    if learn and learn_from:
-        _ = learn_mappings(category_mapping, learn_from)
+    # Factorize on the (description, raw category) pair — the only inputs
+    # the cascade looks at — run the rules once per unique pair, then gather
+    # the per-row answers through the integer codes. The separator cannot
+    # occur in cleaned text, which only keeps [a-z0-9 &.'-].
+    if len(df):
+        codes, uniq = pd.factorize(desc + "\x1f" + raw_clean)
+    else:
+        codes, uniq = np.array([], dtype=np.intp), np.array([], dtype=object)
+    results = []
+    for key in uniq:
+        d, _, r = key.partition("\x1f")
+        results.append(_categorize_unique(d, r, mapping))
+    uniq_cat = np.array([c for c, _ in results], dtype=object)
+    uniq_prov = np.fromiter((p for _, p in results), dtype=np.int8, count=len(results))
+
+    # Build the categorical straight from codes so no row-level hash pass is
+    # needed. Categories are not fixed to CANON because mapping files may
+    # introduce their own labels.
+    label_codes, labels = pd.factorize(uniq_cat)
+    df["Category"] = pd.Categorical.from_codes(
+        label_codes[codes] if len(uniq) else [], categories=labels
+    )
+    df["Merchant"] = df["Merchant"].astype("category")
 
-    exact, contains, regex = _load_mapping(category_mapping) if category_mapping else ([], [], [])
-    prov_counter = Counter()
-    cats = []
-    for _, row in df.iterrows():
-        c, prov = _apply_mapping(row["Description (clean)"], exact, contains, regex)
-        if c:
-            prov_counter[prov] += 1
-            cats.append(_canonicalize(c))
-            continue
-        hay = f"{row['Description (clean)']} {_clean_text(row['Category (raw)'])}".strip()
-        c, prov = _fallback_keyword_rules(hay)
-        if c:
-            prov_counter[prov] += 1
-            cats.append(c)
-            continue
-        raw = _clean_text(row["Category (raw)"])
-        if raw in ALIASES:
-            prov_counter["alias_raw"] += 1
-            cats.append(ALIASES[raw])
-            continue
-        prov_counter["uncategorized"] += 1
-        cats.append("Uncategorized")
-    df["Category"] = cats
+    # Row counts per unique weight the unique-side sentinels, so the counter
+    # never touches a row-length array.
+    row_counts = np.bincount(codes, minlength=len(uniq))
+    counts = np.bincount(uniq_prov, weights=row_counts, minlength=len(_PROVENANCE_LABELS))
+    prov_counter = Counter({name: int(n) for name, n in zip(_PROVENANCE_LABELS, counts) if n})
 
     front = [
         c
@@ -430,14 +633,77 @@ def transform(
         if c in df.columns
     ]
     remaining = [c for c in df.columns if c not in front]
-    df = df[front + remaining]
+    return df[front + remaining], prov_counter
+
+
+def transform(
+    source: Path,
+    category_mapping: Path | None = None,
+    learn_from: Path | None = None,
+    learn: bool = False,
+    report: bool = False,
+    write_parquet: bool = False,
+    account_id: str = "BOA-5670",
+) -> Path:
+    """Transform a bank CSV and write outputs next to the source file."""
+    if not source.exists():
+        raise FileNotFoundError(f"Source file not found: {source}")
+
+    header_line = _find_header_line(source)
+
+    if category_mapping is None:
+        category_mapping = _default_mapping_path_for(source)
+    if learn and learn_from:
+        _ = learn_mappings(category_mapping, learn_from)
+    mapping = _load_mapping(category_mapping) if category_mapping else ({}, [], (None, []))
 
     out_csv = source.with_name(source.stem + "_transformed.csv")
-    df.to_csv(out_csv, index=False)
+    stream = source.stat().st_size >= _STREAM_THRESHOLD_BYTES
+    if not stream:
+        df, prov_counter = _transform_frame(
+            _read_source_csv(source, header_line), account_id, 1, mapping
+        )
+        _write_output_csv(df, out_csv)
+        total = len(df)
+        merchants = df["Merchant"].astype(str).replace("", pd.NA).dropna().value_counts()
+        unc_rows = df.loc[
+            df["Category"] == "Uncategorized", ["Merchant", "Description (clean)"]
+        ].astype(str)
+    else:
+        prov_counter = Counter()
+        total = 0
+        merchants = None
+        unc_parts = []
+        reader = pd.read_csv(
+            source,
+            skiprows=header_line,
+            dtype=str,
+            keep_default_na=False,
+            chunksize=_CHUNK_ROWS,
+        )
+        for i, chunk in enumerate(reader):
+            chunk, counts = _transform_frame(chunk, account_id, total + 1, mapping)
+            chunk.to_csv(out_csv, index=False, mode="w" if i == 0 else "a", header=i == 0)
+            prov_counter.update(counts)
+            total += len(chunk)
+            vc = chunk["Merchant"].astype(str).replace("", pd.NA).dropna().value_counts()
+            merchants = vc if merchants is None else merchants.add(vc, fill_value=0)
+            unc_parts.append(
+                chunk.loc[
+                    chunk["Category"] == "Uncategorized", ["Merchant", "Description (clean)"]
+                ].astype(str)
+            )
+        unc_rows = (
+            pd.concat(unc_parts, ignore_index=True)
+            if unc_parts
+            else pd.DataFrame(columns=["Merchant", "Description (clean)"])
+        )
+        if merchants is None:
+            merchants = pd.Series(dtype="int64")
+        merchants = merchants.sort_values(ascending=False).astype(int)
 
     unc = (
-        df.loc[df["Category"] == "Uncategorized", ["Merchant", "Description (clean)"]]
-        .rename(columns={"Description (clean)": "pattern"})
+        unc_rows.rename(columns={"Description (clean)": "pattern"})
         .assign(type="exact", category="")
         .value_counts(["Merchant", "pattern"])
         .reset_index(name="count")
@@ -449,13 +715,29 @@ def transform(
 
     if write_parquet:
         out_pq = out_csv.with_suffix(".parquet")
-        try:
-            df.to_parquet(out_pq, engine="pyarrow", index=False)
-        except Exception:
-            df.to_parquet(out_pq, engine="fastparquet", index=False)
+        if stream:
+            print(f"[notice] Parquet output is skipped for streamed inputs: {out_pq}")
+        else:
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                # An explicit Arrow table keeps the Merchant/Category
+                # dictionaries as parquet DICT-encoded columns; zstd beats
+                # snappy clearly on this kind of repetitive text.
+                pq.write_table(
+                    pa.Table.from_pandas(df, preserve_index=False),
+                    out_pq,
+                    compression="zstd",
+                    use_dictionary=True,
+                )
+            except Exception:
+                try:
+                    df.to_parquet(out_pq, engine="pyarrow", index=False)
+                except Exception:
+                    df.to_parquet(out_pq, engine="fastparquet", index=False)
 
     if report:
-        total = len(df)
         print("\n=== Transform Report ===")
         print(f"Rows: {total}")
         for key in [
@@ -469,7 +751,7 @@ def transform(
         ]:
             if prov_counter.get(key, 0):
                 print(f"{key:>18}: {prov_counter[key]:5d}  ({prov_counter[key]/total:6.1%})")
-        top_merchants = df["Merchant"].replace("", pd.NA).dropna().value_counts().head(10)
+        top_merchants = merchants.head(10)
         if not top_merchants.empty:
             print("\nTop merchants:")
             for name, cnt in top_merchants.items():
@@ -519,30 +801,24 @@ def learn_mappings(mapping_path: Path | None, learn_src: Path) -> tuple[int, int
     base["type"] = base["type"].str.lower().str.strip().replace("", "exact")
     base["pattern"] = base["pattern"].map(_clean_text)
     base["category"] = base["category"].map(_canonicalize)
-    base["key"] = base["type"] + "\t" + base["pattern"]
-    learned["key"] = learned["type"] + "\t" + learned["pattern"]
-    existing = dict(zip(base["key"], base["category"]))
-    add_rows = []
-    dup = 0
-    conf = 0
-    for _, r in learned.iterrows():
-        key = r["key"]
-        cat = r["category"]
-        if key in existing:
-            if existing[key].lower() == cat.lower():
-                dup += 1
-            else:
-                conf += 1
-            continue
-        add_rows.append(
-            {"type": r["type"], "pattern": r["pattern"], "category": r["category"], "key": key}
-        )
-    added = len(add_rows)
-    if added:
-        base = pd.concat([base, pd.DataFrame(add_rows)], ignore_index=True)
-    base = base.drop(columns=["key"], errors="ignore").drop_duplicates(
-        subset=["type", "pattern"], keep="last"
+    # Anti-join the learned rows against the mapping on (type, pattern):
+    # keys already present split into duplicates and conflicts by category,
+    # everything else is appended. A key listed twice in the mapping keeps
+    # its last category, matching the old dict build.
+    existing = base.set_index(["type", "pattern"])["category"]
+    existing = existing[~existing.index.duplicated(keep="last")]
+    learned_keys = pd.MultiIndex.from_arrays([learned["type"], learned["pattern"]])
+    in_base = pd.Series(learned_keys.isin(existing.index), index=learned.index)
+    base_cat = pd.Series(existing.reindex(learned_keys).to_numpy(), index=learned.index)
+    dup = int(
+        (in_base & (learned["category"].str.lower() == base_cat.str.lower().fillna(""))).sum()
     )
+    conf = int(in_base.sum()) - dup
+    add_df = learned[~in_base]
+    added = len(add_df)
+    if added:
+        base = pd.concat([base, add_df], ignore_index=True)
+    base = base.drop_duplicates(subset=["type", "pattern"], keep="last")
     base = base.sort_values(["type", "pattern"]).reset_index(drop=True)
     base.to_csv(mapping_path, index=False)
     total = len(base)
@@ -1,6 +1,10 @@
 ﻿import pandas as pd
 
-from household_spending.boa_transform import coerce_money, normalize_merchant
+from household_spending.boa_transform import (
+    coerce_money,
+    coerce_money_series,
+    normalize_merchant,
+)
 
 
 def test_coerce_money_basic():
@@ -10,6 +14,16 @@ def test_coerce_money_basic():
     assert pd.isna(coerce_money("not-a-number"))
 
 
+def test_coerce_money_series_matches_scalar():
+    raw = ["$1,234.56", "(45.10)", "", "not-a-number", None]
+    out = coerce_money_series(pd.Series(raw))
+    assert out.iloc[0] == 1234.56
+    assert out.iloc[1] == -45.10
+    assert out.iloc[2] == 0.0
+    assert pd.isna(out.iloc[3])
+    assert out.iloc[4] == 0.0
+
+
 def test_normalize_merchant_simple():
     assert normalize_merchant("STARBUCKS STORE #1234  BOSTON MA".lower()) == "Starbucks"
     assert normalize_merchant("AMZN Mktp US*2H3K  SEATTLE WA".lower()) == "Amazon"